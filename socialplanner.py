@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
@@ -9,6 +10,18 @@ import os
 from PIL import Image
 import io
 import base64
+import hashlib
+import shutil
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 # Configure Streamlit page
 st.set_page_config(page_title="Social Media Content Planner", page_icon="📊", layout="wide")
@@ -55,37 +68,235 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+DATA_FILE = "social_media_posts.parquet"
+
+# JSON store used before posts were kept in Parquet, migrated on first load
+LEGACY_DATA_FILE = "social_media_posts.json"
+
+# Uploaded images are stored here, named by content hash; posts keep only the file name
+IMAGE_DIR = "images"
+
+PLATFORM_ICONS = {
+    "Facebook": "📘",
+    "Instagram": "📸",
+    "Twitter": "🐦",
+    "LinkedIn": "🔗",
+    "TikTok": "📱",
+    "Pinterest": "📌"
+}
+
+POST_COLUMNS = [
+    "title",
+    "content",
+    "platform",
+    "scheduled_date",
+    "scheduled_time",
+    "status",
+    "image",
+    "likes",
+    "comments",
+    "shares",
+    "reach"
+]
+
+# Calendar cell markup; kept on one line so the joined grid stays a single HTML block
+CALENDAR_EMPTY_CELL = "<div style='height: 100px; background-color: #f5f5f5; border-radius: 5px;'></div>"
+CALENDAR_CELL_TEMPLATE = (
+    "<div style='height: 100px; background-color: {bg}; border: {border}; "
+    "border-radius: 5px; padding: 5px; position: relative; overflow: hidden;'>"
+    "<div style='font-weight: bold;'>{day}</div>"
+    "<div style='margin-top: 5px;'>{icons}</div>"
+    "<div style='position: absolute; bottom: 5px; right: 5px; font-size: 0.8rem;'>{n} post{s}</div>"
+    "</div>"
+)
+
+# Post card markup; starts unindented and has no blank lines so joined cards render as HTML
+POST_CARD_TEMPLATE = """<div class='post-card'>
+    <div style='display: flex; justify-content: space-between; margin-bottom: 0.5rem;'>
+        <div>
+            <span class='platform-icon'>{icon}</span>
+            <strong>{platform}</strong> • 
+            <span class='tag'>{status}</span> • 
+            {time}
+        </div>
+    </div>
+    <div><strong>{title}</strong></div>
+    <div style='margin-top: 0.5rem;'>{content}</div>
+</div>
+"""
+TOP_POST_CARD_TEMPLATE = """<div class='post-card' style='border-left: 4px solid #66bb6a;'>
+    <div style='display: flex; justify-content: space-between; margin-bottom: 0.5rem;'>
+        <div>
+            <span class='platform-icon'>{icon}</span>
+            <strong>{platform}</strong> • 
+            {date}
+        </div>
+        <div>
+            <span class='tag' style='background-color: #e8f5e9; color: #2e7d32;'>
+                {engagement} Engagements
+            </span>
+        </div>
+    </div>
+    <div><strong>{title}</strong></div>
+    <div style='margin-top: 0.5rem;'>{content}</div>
+    <div style='display: flex; margin-top: 0.5rem;'>
+        <div style='margin-right: 1rem;'>❤️ {likes}</div>
+        <div style='margin-right: 1rem;'>💬 {comments}</div>
+        <div>🔄 {shares}</div>
+    </div>
+</div>
+"""
+
+# Low-cardinality columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("platform", "status")
+
+# Small non-negative counts, downcast to the narrowest integer dtype that fits
+METRIC_COLUMNS = ("likes", "comments", "shares", "reach")
+
 # Helper functions
-def load_data():
-    """Load saved posts or return empty dataframe if none exists"""
+def prepare_posts_df(df):
+    """Convert post columns to the dtypes the views expect"""
+    for column in CATEGORICAL_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype("category")
+    for column in METRIC_COLUMNS:
+        if column in df:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+    if "scheduled_date" in df:
+        df["scheduled_date"] = pd.to_datetime(df["scheduled_date"], format="%Y-%m-%d")
+    return df
+
+def with_date_strings(df):
+    """Return a copy of the dataframe with scheduled_date formatted as YYYY-MM-DD strings"""
+    return df.assign(scheduled_date=df["scheduled_date"].dt.strftime("%Y-%m-%d"))
+
+def empty_posts_columns():
+    """Return an empty column-oriented post store"""
+    return {column: [] for column in POST_COLUMNS}
+
+def frame_to_columns(df):
+    """Convert a posts dataframe to the column-oriented post store"""
+    return {column: df[column].tolist() for column in POST_COLUMNS}
+
+def data_file_mtime():
+    """Return the modification time of the data file, or None if it does not exist"""
+    if os.path.exists(DATA_FILE):
+        return os.path.getmtime(DATA_FILE)
+    return None
+
+def dump_json(obj):
+    """Serialize obj to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def encode_posts(columns):
+    """Serialize post columns to zstd-compressed Parquet bytes"""
+    buffer = io.BytesIO()
+    pd.DataFrame(columns, columns=POST_COLUMNS).to_parquet(buffer, compression="zstd", index=False)
+    return buffer.getvalue()
+
+def write_image(bytes_data, extension):
+    """Write image bytes to the image directory, named by content hash, and return the file name"""
+    filename = hashlib.sha1(bytes_data).hexdigest() + extension
+    path = os.path.join(IMAGE_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(IMAGE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(bytes_data)
+    return filename
+
+def migrate_legacy_image(base64_string):
+    """Write an inline base64 image from the legacy store to the image directory and return its file name"""
+    if not isinstance(base64_string, str) or not base64_string:
+        return None
+    bytes_data = base64.b64decode(base64_string)
+    extension = "." + Image.open(io.BytesIO(bytes_data)).format.lower()
+    return write_image(bytes_data, extension)
+
+def load_legacy_data():
+    """Read posts from the legacy JSON file as a dict of column lists"""
+    with open(LEGACY_DATA_FILE, "r") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        # Oldest layout: a list of records
+        columns = {column: [record.get(column) for record in data] for column in POST_COLUMNS}
+    else:
+        columns = data["columns"]
+    # The legacy store kept images inline as base64
+    columns["image"] = [migrate_legacy_image(image) for image in columns["image"]]
+    return columns
+
+@st.cache_data(show_spinner=False)
+def load_data(mtime=None):
+    """Load saved posts as a dict of column lists, empty if none exist
+
+    `mtime` is only used as part of the cache key, so the cached posts
+    are dropped whenever the data file changes on disk.
+    """
     try:
-        if os.path.exists("social_media_posts.json"):
-            with open("social_media_posts.json", "r") as f:
-                data = json.load(f)
-            return pd.DataFrame(data)
+        if os.path.exists(DATA_FILE):
+            return frame_to_columns(pd.read_parquet(DATA_FILE).reindex(columns=POST_COLUMNS))
+        if os.path.exists(LEGACY_DATA_FILE):
+            # Migrate the JSON store to Parquet once
+            columns = load_legacy_data()
+            with open(DATA_FILE, "wb") as f:
+                f.write(encode_posts(columns))
+            return columns
     except Exception as e:
         st.error(f"Error loading data: {e}")
     
-    # Default empty dataframe
-    return pd.DataFrame({
-        "title": [],
-        "content": [],
-        "platform": [],
-        "scheduled_date": [],
-        "scheduled_time": [],
-        "status": [],
-        "image": [],
-        "likes": [],
-        "comments": [],
-        "shares": [],
-        "reach": []
-    })
-
-def save_data(df):
-    """Save dataframe to JSON file"""
+    return empty_posts_columns()
+
+def get_posts_df():
+    """Return the posts dataframe, rebuilding it from the post columns only after they change"""
+    if st.session_state.get("_posts_df_rev") != st.session_state._posts_rev:
+        st.session_state._posts_df = prepare_posts_df(
+            pd.DataFrame(st.session_state.posts_columns, columns=POST_COLUMNS)
+        )
+        st.session_state._posts_df_rev = st.session_state._posts_rev
+    return st.session_state._posts_df
+
+def get_filter_options():
+    """Return the sidebar platform and status options, recomputed only after the posts change"""
+    if st.session_state.get("_filter_options_rev") != st.session_state._posts_rev:
+        posts_df = get_posts_df()
+        # Categories of a column cast with astype("category") are its sorted unique values
+        st.session_state._filter_options = (
+            ["All"] + posts_df["platform"].cat.categories.tolist(),
+            ["All"] + posts_df["status"].cat.categories.tolist()
+        )
+        st.session_state._filter_options_rev = st.session_state._posts_rev
+    return st.session_state._filter_options
+
+def content_hash(payload):
+    """Return a fast, non-cryptographic hash of a bytes payload"""
+    if xxhash is not None:
+        return xxhash.xxh64(payload).intdigest()
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+def data_file_signature():
+    """Return the data file's modification time and size, or None if it does not exist"""
+    if os.path.exists(DATA_FILE):
+        stat = os.stat(DATA_FILE)
+        return (stat.st_mtime_ns, stat.st_size)
+    return None
+
+def save_data(columns):
+    """Save post columns to the Parquet data file, skipping the write if nothing changed
+
+    The write is only skipped when this session last wrote the same payload
+    and the file has not been touched since, e.g. by another session.
+    """
     try:
-        with open("social_media_posts.json", "w") as f:
-            json.dump(df.to_dict(orient="records"), f, indent=2)
+        payload = encode_posts(columns)
+        payload_hash = content_hash(payload)
+        signature = data_file_signature()
+        if signature is not None and st.session_state.get("_posts_saved") == (payload_hash, signature):
+            return True
+        with open(DATA_FILE, "wb") as f:
+            f.write(payload)
+        st.session_state._posts_saved = (payload_hash, data_file_signature())
         return True
     except Exception as e:
         st.error(f"Error saving data: {e}")
@@ -93,33 +304,97 @@ def save_data(df):
 
 def get_platform_icon(platform):
     """Return the appropriate emoji icon for a platform"""
-    icons = {
-        "Facebook": "📘",
-        "Instagram": "📸",
-        "Twitter": "🐦",
-        "LinkedIn": "🔗",
-        "TikTok": "📱",
-        "Pinterest": "📌"
-    }
-    return icons.get(platform, "📱")
+    return PLATFORM_ICONS.get(platform, "📱")
 
-def encode_image(image_file):
-    """Encode uploaded image file to base64 string for storage"""
+def store_image(image_file):
+    """Write an uploaded image file to the image directory and return its file name"""
     if image_file is not None:
-        bytes_data = image_file.getvalue()
-        return base64.b64encode(bytes_data).decode()
+        extension = os.path.splitext(image_file.name)[1].lower()
+        return write_image(image_file.getvalue(), extension)
     return None
 
-def decode_image(base64_string):
-    """Decode base64 string to image for display"""
-    if base64_string:
-        img_data = base64.b64decode(base64_string)
-        return Image.open(io.BytesIO(img_data))
+def open_image(filename):
+    """Open a stored image for display"""
+    if filename:
+        return Image.open(os.path.join(IMAGE_DIR, filename))
     return None
 
+def shift_calendar_month(delta):
+    """Move the calendar by delta months"""
+    month_index = st.session_state.calendar_year * 12 + st.session_state.calendar_month - 1 + delta
+    year, month = divmod(month_index, 12)
+    st.session_state.calendar_year = year
+    st.session_state.calendar_month = month + 1
+
+def jump_to_date():
+    """Select the date picked in the calendar's date input and show its month"""
+    jump_date = st.session_state.cal_date
+    st.session_state.selected_date = jump_date
+    st.session_state.calendar_month = jump_date.month
+    st.session_state.calendar_year = jump_date.year
+
+# cache_resource hands back the stored figures without a pickle round trip;
+# callers only pass them to st.plotly_chart and never mutate them
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_platform_figures(platform_data):
+    """Build the engagement and engagement rate bar charts from per-platform aggregates"""
+    platforms = platform_data["platform"].astype(str).to_numpy()
+    
+    # Stacked bar chart for engagement by platform
+    fig = go.Figure()
+    for metric, color in zip(["likes", "comments", "shares"], ["#1976d2", "#ff7043", "#66bb6a"]):
+        fig.add_bar(x=platforms, y=platform_data[metric].to_numpy(), name=metric, marker_color=color)
+    fig.update_layout(
+        barmode="relative",
+        title="Engagement by Platform",
+        xaxis_title="Platform",
+        yaxis_title="Count",
+        legend_title_text="Metric"
+    )
+    
+    # Engagement rate by platform, one color per platform
+    palette = px.colors.qualitative.Bold
+    fig_rate = go.Figure(go.Bar(
+        x=platforms,
+        y=platform_data["engagement_rate"].to_numpy(),
+        marker_color=[palette[i % len(palette)] for i in range(len(platforms))]
+    ))
+    fig_rate.update_layout(
+        title="Engagement Rate by Platform",
+        xaxis_title="Platform",
+        yaxis_title="Engagement Rate (%)"
+    )
+    
+    return fig, fig_rate
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_time_figure(time_data):
+    """Build the line chart of post metrics over time from per-date aggregates"""
+    fig_time = go.Figure()
+    dates = time_data["date"].to_numpy()
+    metrics = ["likes", "comments", "shares", "reach"]
+    colors = ["#1976d2", "#ff7043", "#66bb6a", "#9c27b0"]
+    for metric, color in zip(metrics, colors):
+        # WebGL traces keep browser rendering fast as the number of dates grows
+        fig_time.add_trace(go.Scattergl(
+            x=dates,
+            y=time_data[metric].to_numpy(),
+            mode="lines",
+            name=metric,
+            line_color=color
+        ))
+    fig_time.update_layout(
+        title="Performance Metrics Over Time",
+        xaxis_title="Date",
+        yaxis_title="Count",
+        legend_title_text="Metric"
+    )
+    return fig_time
+
 # Initialize session state variables
-if "posts_df" not in st.session_state:
-    st.session_state.posts_df = load_data()
+if "posts_columns" not in st.session_state:
+    st.session_state.posts_columns = load_data(data_file_mtime())
+    st.session_state._posts_rev = 0
 if "current_view" not in st.session_state:
     st.session_state.current_view = "Calendar"
 if "selected_date" not in st.session_state:
@@ -127,49 +402,46 @@ if "selected_date" not in st.session_state:
 if "expanded_post" not in st.session_state:
     st.session_state.expanded_post = None
 
-# Generate demo data if the dataframe is empty
-if len(st.session_state.posts_df) == 0:
+# Generate demo data if there are no posts
+if len(st.session_state.posts_columns["title"]) == 0:
     # Create some demo data
     demo_dates = [
         datetime.now().date() + timedelta(days=i) 
         for i in range(-5, 15)
     ]
     
-    demo_platforms = ["Instagram", "Facebook", "Twitter", "LinkedIn", "TikTok"]
-    demo_statuses = ["Published", "Scheduled", "Draft", "Published", "Scheduled"]
-    
-    demo_data = []
-    for i in range(20):
-        platform = demo_platforms[i % len(demo_platforms)]
-        status = demo_statuses[i % len(demo_statuses)]
-        likes = 0
-        comments = 0
-        shares = 0
-        reach = 0
-        
-        # Add some performance metrics for published posts
-        if status == "Published":
-            likes = int(100 + 50 * (i % 7))
-            comments = int(10 + 5 * (i % 5))
-            shares = int(5 + 3 * (i % 4))
-            reach = int(500 + 100 * (i % 10))
-        
-        demo_data.append({
-            "title": f"Demo Post {i+1}",
-            "content": f"This is example content for {platform} post #{i+1}. #demo #socialmedia",
-            "platform": platform,
-            "scheduled_date": demo_dates[i % len(demo_dates)].strftime("%Y-%m-%d"),
-            "scheduled_time": f"{8 + (i % 8)}:00",
-            "status": status,
-            "image": None,
-            "likes": likes,
-            "comments": comments,
-            "shares": shares,
-            "reach": reach
-        })
-    
-    st.session_state.posts_df = pd.DataFrame(demo_data)
-    save_data(st.session_state.posts_df)
+    demo_platforms = np.array(["Instagram", "Facebook", "Twitter", "LinkedIn", "TikTok"])
+    demo_statuses = np.array(["Published", "Scheduled", "Draft", "Published", "Scheduled"])
+    
+    i = np.arange(20)
+    platform = np.take(demo_platforms, i % len(demo_platforms))
+    status = np.take(demo_statuses, i % len(demo_statuses))
+    
+    # Only published posts get performance metrics
+    published = status == "Published"
+    
+    demo_data = {
+        "title": [f"Demo Post {k + 1}" for k in i],
+        "content": [
+            f"This is example content for {p} post #{k + 1}. #demo #socialmedia"
+            for k, p in zip(i, platform)
+        ],
+        "platform": platform,
+        "scheduled_date": [demo_dates[k % len(demo_dates)].strftime("%Y-%m-%d") for k in i],
+        "scheduled_time": [f"{8 + (k % 8)}:00" for k in i],
+        "status": status,
+        "image": None,
+        "likes": np.where(published, 100 + 50 * (i % 7), 0),
+        "comments": np.where(published, 10 + 5 * (i % 5), 0),
+        "shares": np.where(published, 5 + 3 * (i % 4), 0),
+        "reach": np.where(published, 500 + 100 * (i % 10), 0)
+    }
+    
+    st.session_state.posts_columns = frame_to_columns(pd.DataFrame(demo_data))
+    st.session_state._posts_rev += 1
+    save_data(st.session_state.posts_columns)
+
+posts_df = get_posts_df()
 
 # Main layout
 st.markdown('<h1 class="main-header">📊 Social Media Content Planner</h1>', unsafe_allow_html=True)
@@ -188,26 +460,32 @@ with st.sidebar:
     
     # Quick filters
     st.markdown("## 🔍 Quick Filters")
+    platform_options, status_options = get_filter_options()
     platform_filter = st.multiselect(
         "Platform",
-        options=["All"] + sorted(st.session_state.posts_df["platform"].unique().tolist()),
+        options=platform_options,
         default="All"
     )
     status_filter = st.multiselect(
         "Status",
-        options=["All"] + sorted(st.session_state.posts_df["status"].unique().tolist()),
+        options=status_options,
         default="All"
     )
     
-    # Apply filters to the dataframe
-    filtered_df = st.session_state.posts_df.copy()
+    # Apply filters to the dataframe; views must not mutate filtered_df,
+    # since it is the shared posts dataframe itself when no filter is active
+    mask = None
     if platform_filter and "All" not in platform_filter:
-        filtered_df = filtered_df[filtered_df["platform"].isin(platform_filter)]
+        mask = posts_df["platform"].isin(platform_filter)
     if status_filter and "All" not in status_filter:
-        filtered_df = filtered_df[filtered_df["status"].isin(status_filter)]
+        status_mask = posts_df["status"].isin(status_filter)
+        mask = status_mask if mask is None else mask & status_mask
+    filtered_df = posts_df if mask is None else posts_df[mask]
 
 # Calendar View
-if st.session_state.current_view == "Calendar":
+@st.fragment
+def calendar_view(filtered_df):
+    """Render the month calendar and the posts for the selected date"""
     # Get current month and year
     current_date = datetime.now().date()
     if "calendar_month" not in st.session_state:
@@ -218,131 +496,113 @@ if st.session_state.current_view == "Calendar":
     col1, col2, col3 = st.columns([2, 3, 2])
     
     with col1:
-        if st.button("⬅️ Previous Month"):
-            if st.session_state.calendar_month == 1:
-                st.session_state.calendar_month = 12
-                st.session_state.calendar_year -= 1
-            else:
-                st.session_state.calendar_month -= 1
-            st.rerun()
+        st.button("⬅️ Previous Month", on_click=shift_calendar_month, args=(-1,))
     
     with col2:
         month_name = calendar.month_name[st.session_state.calendar_month]
         st.markdown(f"## {month_name} {st.session_state.calendar_year}")
     
     with col3:
-        if st.button("Next Month ➡️"):
-            if st.session_state.calendar_month == 12:
-                st.session_state.calendar_month = 1
-                st.session_state.calendar_year += 1
-            else:
-                st.session_state.calendar_month += 1
-            st.rerun()
+        st.button("Next Month ➡️", on_click=shift_calendar_month, args=(1,))
     
     # Create calendar
     cal = calendar.monthcalendar(st.session_state.calendar_year, st.session_state.calendar_month)
     
-    # Create columns for each day of the week
-    cols = st.columns(7)
-    for i, day_name in enumerate(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]):
-        cols[i].markdown(f"<div style='text-align: center; font-weight: bold;'>{day_name}</div>", unsafe_allow_html=True)
-    
     # Create a dataframe with just the current month's posts
-    month_start = f"{st.session_state.calendar_year}-{st.session_state.calendar_month:02d}-01"
-    month_end = (datetime.strptime(month_start, "%Y-%m-%d") + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-    month_end = month_end.strftime("%Y-%m-%d")
+    month_start = pd.Timestamp(year=st.session_state.calendar_year, month=st.session_state.calendar_month, day=1)
+    month_end = month_start + pd.offsets.MonthEnd(0)
     
     month_posts = filtered_df[
         (filtered_df["scheduled_date"] >= month_start) & 
         (filtered_df["scheduled_date"] <= month_end)
     ]
     
-    # Create calendar grid
+    # Index the month's posts by day of month once instead of filtering per cell
+    day_groups = month_posts.groupby(month_posts["scheduled_date"].dt.day, sort=False)
+    day_counts = day_groups.size().to_dict()
+    day_platforms = day_groups["platform"].unique().to_dict()
+    
+    # Days of the shown month to highlight, or None if they fall in another month
+    shown_month = (st.session_state.calendar_year, st.session_state.calendar_month)
+    selected_date = st.session_state.selected_date
+    today_day = current_date.day if (current_date.year, current_date.month) == shown_month else None
+    selected_day = selected_date.day if (selected_date.year, selected_date.month) == shown_month else None
+    
+    # Build the whole calendar as a single CSS grid so it renders in one markdown call
+    calendar_html = ["<div style='display: grid; grid-template-columns: repeat(7, 1fr); gap: 4px;'>"]
+    for day_name in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]:
+        calendar_html.append(f"<div style='text-align: center; font-weight: bold;'>{day_name}</div>")
+    
     for week in cal:
-        cols = st.columns(7)
-        for i, day in enumerate(week):
+        for day in week:
             if day == 0:
                 # Empty cell for days not in this month
-                cols[i].markdown("<div style='height: 100px; background-color: #f5f5f5; border-radius: 5px;'></div>", unsafe_allow_html=True)
+                calendar_html.append(CALENDAR_EMPTY_CELL)
             else:
-                date_str = f"{st.session_state.calendar_year}-{st.session_state.calendar_month:02d}-{day:02d}"
-                is_current_date = date_str == current_date.strftime("%Y-%m-%d")
-                is_selected_date = date_str == st.session_state.selected_date.strftime("%Y-%m-%d")
-                
                 # Style for the date cell
-                bg_color = "#e3f2fd" if is_selected_date else "#ffffff"
-                border = "2px solid #1976d2" if is_current_date else "1px solid #e0e0e0"
+                bg_color = "#e3f2fd" if day == selected_day else "#ffffff"
+                border = "2px solid #1976d2" if day == today_day else "1px solid #e0e0e0"
                 
                 # Get posts for this day
-                day_posts = month_posts[month_posts["scheduled_date"] == date_str]
-                day_post_count = len(day_posts)
+                day_post_count = day_counts.get(day, 0)
                 
                 # Create platform indicators
-                platform_indicators = ""
-                for platform in day_posts["platform"].unique():
-                    platform_indicators += f"<span class='platform-icon'>{get_platform_icon(platform)}</span>"
-                
-                # Display date cell with post count and platform indicators
-                cell_content = f"""
-                <div style='
-                    height: 100px; 
-                    background-color: {bg_color}; 
-                    border: {border}; 
-                    border-radius: 5px; 
-                    padding: 5px; 
-                    position: relative; 
-                    overflow: hidden;'
-                    onclick=''
-                >
-                    <div style='font-weight: bold;'>{day}</div>
-                    <div style='margin-top: 5px;'>
-                        {platform_indicators}
-                    </div>
-                    <div style='position: absolute; bottom: 5px; right: 5px; font-size: 0.8rem;'>
-                        {day_post_count} post{'' if day_post_count == 1 else 's'}
-                    </div>
-                </div>
-                """
+                platform_indicators = "".join(
+                    f"<span class='platform-icon'>{get_platform_icon(platform)}</span>"
+                    for platform in day_platforms.get(day, ())
+                )
                 
-                if cols[i].markdown(cell_content, unsafe_allow_html=True):
-                    # Set the selected date when a cell is clicked
-                    st.session_state.selected_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    st.rerun()
+                # Date cell with post count and platform indicators
+                calendar_html.append(CALENDAR_CELL_TEMPLATE.format(
+                    bg=bg_color,
+                    border=border,
+                    day=day,
+                    icons=platform_indicators,
+                    n=day_post_count,
+                    s="" if day_post_count == 1 else "s"
+                ))
+    
+    calendar_html.append("</div>")
+    st.markdown("".join(calendar_html), unsafe_allow_html=True)
+    
+    # Date selection; the calendar cells are plain HTML and cannot be clicked
+    st.date_input("Jump to date", value=selected_date, key="cal_date", on_change=jump_to_date)
     
     # Display posts for the selected date
     st.markdown(f"## Posts for {st.session_state.selected_date.strftime('%B %d, %Y')}")
     
-    selected_date_str = st.session_state.selected_date.strftime("%Y-%m-%d")
-    selected_date_posts = filtered_df[filtered_df["scheduled_date"] == selected_date_str]
+    selected_date_posts = filtered_df[filtered_df["scheduled_date"] == pd.Timestamp(st.session_state.selected_date)]
     
     if len(selected_date_posts) == 0:
         st.info("No posts scheduled for this date.")
     else:
-        for idx, post in selected_date_posts.iterrows():
-            with st.container():
-                col1, col2 = st.columns([4, 1])
-                with col1:
-                    st.markdown(f"""
-                    <div class='post-card'>
-                        <div style='display: flex; justify-content: space-between; margin-bottom: 0.5rem;'>
-                            <div>
-                                <span class='platform-icon'>{get_platform_icon(post['platform'])}</span>
-                                <strong>{post['platform']}</strong> • 
-                                <span class='tag'>{post['status']}</span> • 
-                                {post['scheduled_time']}
-                            </div>
-                        </div>
-                        <div><strong>{post['title']}</strong></div>
-                        <div style='margin-top: 0.5rem;'>{post['content']}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                with col2:
-                    st.button("Edit", key=f"edit_{idx}", help="Edit this post")
-                    st.button("Delete", key=f"delete_{idx}", help="Delete this post")
+        post_cards = [
+            POST_CARD_TEMPLATE.format(
+                icon=get_platform_icon(post.platform),
+                platform=post.platform,
+                status=post.status,
+                time=post.scheduled_time,
+                title=post.title,
+                content=post.content
+            )
+            for post in selected_date_posts.itertuples(index=False)
+        ]
+        st.markdown("".join(post_cards), unsafe_allow_html=True)
+        
+        # One set of post actions instead of a pair of buttons per card
+        titles = dict(zip(selected_date_posts.index, selected_date_posts["title"]))
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            st.selectbox("Post", options=list(titles), format_func=titles.get, key="manage_post")
+        with col2:
+            st.button("Edit", key="edit_post", help="Edit this post")
+        with col3:
+            st.button("Delete", key="delete_post", help="Delete this post")
 
 # Create Post View
-elif st.session_state.current_view == "Create Post":
+@st.fragment
+def create_post_view():
+    """Render the new post form"""
     st.markdown("## 📝 Create New Post")
     
     with st.form("new_post_form"):
@@ -378,8 +638,8 @@ elif st.session_state.current_view == "Create Post":
             elif not post_content:
                 st.error("Please enter post content")
             else:
-                # Encode image if provided
-                encoded_image = encode_image(post_image) if post_image else None
+                # Store image if provided
+                image_filename = store_image(post_image) if post_image else None
                 
                 # Create new post
                 new_post = {
@@ -389,28 +649,28 @@ elif st.session_state.current_view == "Create Post":
                     "scheduled_date": post_date.strftime("%Y-%m-%d"),
                     "scheduled_time": post_time.strftime("%H:%M"),
                     "status": post_status,
-                    "image": encoded_image,
+                    "image": image_filename,
                     "likes": 0,
                     "comments": 0,
                     "shares": 0,
                     "reach": 0
                 }
                 
-                # Add to dataframe
-                st.session_state.posts_df = pd.concat([
-                    st.session_state.posts_df, 
-                    pd.DataFrame([new_post])
-                ], ignore_index=True)
+                # Add to post columns; the dataframe is rebuilt lazily on next use
+                for column, values in st.session_state.posts_columns.items():
+                    values.append(new_post[column])
+                st.session_state._posts_rev += 1
                 
                 # Save data
-                if save_data(st.session_state.posts_df):
+                if save_data(st.session_state.posts_columns):
                     st.success("Post saved successfully!")
                     # Clear form (this requires a rerun)
                     st.session_state.clear_form = True
                     st.rerun()
 
 # Analytics View
-elif st.session_state.current_view == "Analytics":
+def analytics_view(filtered_df):
+    """Render performance metrics and charts for published posts"""
     st.markdown("## 📊 Performance Analytics")
     
     # Only analyze published posts
@@ -419,12 +679,21 @@ elif st.session_state.current_view == "Analytics":
     if len(published_posts) == 0:
         st.info("No published posts to analyze yet.")
     else:
-        # Convert scheduled_date to datetime
-        published_posts["date"] = pd.to_datetime(published_posts["scheduled_date"])
+        # Add total engagement column
+        published_posts["total_engagement"] = published_posts[["likes", "comments", "shares"]].to_numpy().sum(axis=1)
+        
+        # Metrics summed by both the platform and the time aggregations
+        agg_spec = {
+            "likes": "sum",
+            "comments": "sum",
+            "shares": "sum",
+            "reach": "sum",
+            "total_engagement": "sum"
+        }
         
         # Overall metrics
         total_posts = len(published_posts)
-        total_engagement = published_posts["likes"].sum() + published_posts["comments"].sum() + published_posts["shares"].sum()
+        total_engagement = published_posts["total_engagement"].sum()
         total_reach = published_posts["reach"].sum()
         avg_engagement_per_post = total_engagement / total_posts if total_posts > 0 else 0
         
@@ -466,104 +735,55 @@ elif st.session_state.current_view == "Analytics":
         st.markdown("### Engagement by Platform")
         
         # Aggregate data by platform
-        platform_data = published_posts.groupby("platform").agg({
-            "likes": "sum",
-            "comments": "sum",
-            "shares": "sum",
-            "reach": "sum"
-        }).reset_index()
+        platform_data = published_posts.groupby("platform", observed=True, sort=False).agg(agg_spec).reset_index()
         
         # Calculate engagement rate
-        platform_data["engagement_rate"] = (
-            (platform_data["likes"] + platform_data["comments"] + platform_data["shares"]) / 
-            platform_data["reach"] * 100
-        )
+        platform_data["engagement_rate"] = platform_data["total_engagement"] / platform_data["reach"] * 100
         
-        # Create stacked bar chart for engagement by platform
-        fig = px.bar(
-            platform_data,
-            x="platform",
-            y=["likes", "comments", "shares"],
-            labels={"value": "Count", "platform": "Platform", "variable": "Metric"},
-            title="Engagement by Platform",
-            color_discrete_sequence=["#1976d2", "#ff7043", "#66bb6a"]
-        )
+        # Charts are cached on the aggregated data, so unchanged data skips figure construction
+        fig, fig_rate = build_platform_figures(platform_data)
         
         st.plotly_chart(fig, use_container_width=True)
         
-        # Engagement rate by platform
-        fig_rate = px.bar(
-            platform_data,
-            x="platform",
-            y="engagement_rate",
-            labels={"engagement_rate": "Engagement Rate (%)", "platform": "Platform"},
-            title="Engagement Rate by Platform",
-            color="platform",
-            color_discrete_sequence=px.colors.qualitative.Bold
-        )
-        
         st.plotly_chart(fig_rate, use_container_width=True)
         
         # Performance over time
         st.markdown("### Performance Over Time")
         
         # Aggregate data by date
-        time_data = published_posts.groupby("date").agg({
-            "likes": "sum",
-            "comments": "sum",
-            "shares": "sum",
-            "reach": "sum"
-        }).reset_index()
+        time_data = published_posts.groupby("scheduled_date").agg(agg_spec).reset_index().rename(columns={"scheduled_date": "date"})
         
         # Create line chart for performance over time
-        fig_time = px.line(
-            time_data,
-            x="date",
-            y=["likes", "comments", "shares", "reach"],
-            labels={"value": "Count", "date": "Date", "variable": "Metric"},
-            title="Performance Metrics Over Time",
-            color_discrete_sequence=["#1976d2", "#ff7043", "#66bb6a", "#9c27b0"]
-        )
+        fig_time = build_time_figure(time_data)
         
         st.plotly_chart(fig_time, use_container_width=True)
         
         # Best performing posts
         st.markdown("### Top Performing Posts")
         
-        # Add total engagement column
-        published_posts["total_engagement"] = published_posts["likes"] + published_posts["comments"] + published_posts["shares"]
-        
         # Sort by total engagement
         top_posts = published_posts.sort_values("total_engagement", ascending=False).head(5)
         
-        for idx, post in top_posts.iterrows():
-            with st.container():
-                st.markdown(f"""
-                <div class='post-card' style='border-left: 4px solid #66bb6a;'>
-                    <div style='display: flex; justify-content: space-between; margin-bottom: 0.5rem;'>
-                        <div>
-                            <span class='platform-icon'>{get_platform_icon(post['platform'])}</span>
-                            <strong>{post['platform']}</strong> • 
-                            {post['scheduled_date']}
-                        </div>
-                        <div>
-                            <span class='tag' style='background-color: #e8f5e9; color: #2e7d32;'>
-                                {post['total_engagement']} Engagements
-                            </span>
-                        </div>
-                    </div>
-                    <div><strong>{post['title']}</strong></div>
-                    <div style='margin-top: 0.5rem;'>{post['content']}</div>
-                    <div style='display: flex; margin-top: 0.5rem;'>
-                        <div style='margin-right: 1rem;'>❤️ {post['likes']}</div>
-                        <div style='margin-right: 1rem;'>💬 {post['comments']}</div>
-                        <div>🔄 {post['shares']}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        top_posts_html = [
+            TOP_POST_CARD_TEMPLATE.format(
+                icon=get_platform_icon(post.platform),
+                platform=post.platform,
+                date=post.scheduled_date.strftime("%Y-%m-%d"),
+                engagement=post.total_engagement,
+                title=post.title,
+                content=post.content,
+                likes=post.likes,
+                comments=post.comments,
+                shares=post.shares
+            )
+            for post in top_posts.itertuples(index=False)
+        ]
+        
+        st.markdown("".join(top_posts_html), unsafe_allow_html=True)
 
 # Settings View
-elif st.session_state.current_view == "Settings":
+def settings_view(posts_df):
+    """Render data export, import and reset options"""
     st.markdown("## ⚙️ Settings")
     
     with st.expander("Export Data", expanded=True):
@@ -574,7 +794,7 @@ elif st.session_state.current_view == "Settings":
         with col1:
             if st.button("Export to CSV"):
                 # Save dataframe to CSV for download
-                csv = st.session_state.posts_df.to_csv(index=False)
+                csv = with_date_strings(posts_df).to_csv(index=False)
                 st.download_button(
                     label="Download CSV",
                     data=csv,
@@ -585,7 +805,7 @@ elif st.session_state.current_view == "Settings":
         with col2:
             if st.button("Export to JSON"):
                 # Save dataframe to JSON for download
-                json_str = st.session_state.posts_df.to_json(orient="records", indent=2)
+                json_str = dump_json(with_date_strings(posts_df).to_dict(orient="records"))
                 st.download_button(
                     label="Download JSON",
                     data=json_str,
@@ -608,8 +828,10 @@ elif st.session_state.current_view == "Settings":
                     st.success(f"Successfully imported {len(imported_df)} posts from JSON.")
                 
                 if st.button("Replace Current Data with Imported Data"):
-                    st.session_state.posts_df = imported_df
-                    save_data(st.session_state.posts_df)
+                    imported_df = with_date_strings(prepare_posts_df(imported_df.reindex(columns=POST_COLUMNS)))
+                    st.session_state.posts_columns = frame_to_columns(imported_df)
+                    st.session_state._posts_rev += 1
+                    save_data(st.session_state.posts_columns)
                     st.success("Data replaced successfully!")
                     st.rerun()
             
@@ -617,22 +839,22 @@ elif st.session_state.current_view == "Settings":
                 st.error(f"Error importing data: {e}")
     
     with st.expander("Reset Application"):
-        st.write("⚠️ Warning: This will delete all your posts and reset the application.")
+        st.write("⚠️ Warning: This will delete all your posts and uploaded images and reset the application.")
         
         if st.button("Reset All Data", help="This will delete all your posts"):
-            st.session_state.posts_df = pd.DataFrame({
-                "title": [],
-                "content": [],
-                "platform": [],
-                "scheduled_date": [],
-                "scheduled_time": [],
-                "status": [],
-                "image": [],
-                "likes": [],
-                "comments": [],
-                "shares": [],
-                "reach": []
-            })
-            save_data(st.session_state.posts_df)
+            shutil.rmtree(IMAGE_DIR, ignore_errors=True)
+            st.session_state.posts_columns = empty_posts_columns()
+            st.session_state._posts_rev += 1
+            save_data(st.session_state.posts_columns)
             st.success("Application reset successfully!")
             st.rerun()
+
+# Render the selected view; fragment views rerun on their own when their widgets change
+if st.session_state.current_view == "Calendar":
+    calendar_view(filtered_df)
+elif st.session_state.current_view == "Create Post":
+    create_post_view()
+elif st.session_state.current_view == "Analytics":
+    analytics_view(filtered_df)
+elif st.session_state.current_view == "Settings":
+    settings_view(posts_df)